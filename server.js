@@ -11,6 +11,9 @@ connectDB();
 
 // Init Middleware
 app.use(express.json());
+// Slide images are published under content-hashed names (visuals.py --publish),
+// so they never change and can be cached forever; slides.json is revalidated
+app.use('/slides', express.static(path.join(__dirname, 'public', 'slides'), { immutable: true, maxAge: '1y' }));
 app.use(express.static('public'));
 app.use(session({
     secret: 'your_secret_key',
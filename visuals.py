@@ -4,17 +4,461 @@ import numpy as np
 import pandas as pd
 import networkx as nx
 from PIL import Image, ImageDraw, ImageFont
-from matplotlib.patches import Rectangle, Circle, Arrow, Polygon
+from matplotlib.patches import Rectangle, Circle, Arrow, Polygon, Patch
 import matplotlib.colors as mcolors
 import matplotlib.patheffects as path_effects
+from matplotlib import cbook
+from matplotlib.animation import FFMpegWriter
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import RendererBase
+from matplotlib.backends.backend_agg import FigureCanvasAgg, RendererAgg
+from matplotlib.collections import Collection
+from matplotlib.font_manager import FontProperties
+from matplotlib.lines import Line2D
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2D, Bbox, TransformedPath
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import ast
+import base64
+import contextlib
 import datetime
+import difflib
+import functools
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import queue
+import struct
+import subprocess
+import sys
+import tarfile
+import threading
+import time
+import traceback
+import types
+import zipfile
+import zlib
+from multiprocessing import shared_memory
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Optional rasterizers, see RASTERIZERS. OSError is what cairocffi raises
+# when it is installed without the libcairo shared library.
+try:
+    import mplcairo
+except (ImportError, OSError):
+    mplcairo = None
+try:
+    from matplotlib.backends import backend_cairo
+except (ImportError, OSError):  # needs pycairo or cairocffi
+    backend_cairo = None
 
 # Set consistent styling for all visualizations
 plt.style.use('seaborn-v0_8-whitegrid')
 colors = sns.color_palette("viridis", 8)
 accent_colors = sns.color_palette("Set2", 8)
 
+# Output settings shared by every slide builder. When BAND_ROWS is set the
+# slides are rasterized in horizontal bands of that many pixel rows, so peak
+# memory follows the band size instead of the full image (poster exports).
+OUTPUT_DPI = 300
+BAND_ROWS = None
+
+# Incremental PNG encoder: rows are filtered and compressed as they arrive,
+# so the full image never has to be held in memory.
+class PNGStreamWriter:
+    def __init__(self, fileobj, width, height, dpi=None):
+        self.fileobj = fileobj
+        self.width = width
+        self.height = height
+        self.rows_written = 0
+        self.compressor = zlib.compressobj(6)
+
+        fileobj.write(b'\x89PNG\r\n\x1a\n')
+        # 8-bit RGBA, deflate, adaptive filtering, no interlace
+        self._write_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0))
+        if dpi:
+            pixels_per_meter = int(round(dpi / 0.0254))
+            self._write_chunk(b'pHYs', struct.pack('>IIB', pixels_per_meter, pixels_per_meter, 1))
+
+    def _write_chunk(self, tag, data):
+        self.fileobj.write(struct.pack('>I', len(data)))
+        self.fileobj.write(tag)
+        self.fileobj.write(data)
+        self.fileobj.write(struct.pack('>I', zlib.crc32(data, zlib.crc32(tag))))
+
+    def write_rows(self, rows):
+        # rows is a (n, width, 4) uint8 array; apply the PNG "Sub" filter
+        rows = rows.reshape(rows.shape[0], self.width * 4)
+        filtered = np.empty((rows.shape[0], rows.shape[1] + 1), dtype=np.uint8)
+        filtered[:, 0] = 1
+        filtered[:, 1:5] = rows[:, :4]
+        np.subtract(rows[:, 4:], rows[:, :-4], out=filtered[:, 5:])
+        data = self.compressor.compress(filtered.tobytes())
+        if data:
+            self._write_chunk(b'IDAT', data)
+        self.rows_written += rows.shape[0]
+
+    def close(self):
+        if self.rows_written != self.height:
+            raise ValueError(f"PNG expects {self.height} rows, got {self.rows_written}")
+        self._write_chunk(b'IDAT', self.compressor.flush())
+        self._write_chunk(b'IEND', b'')
+
+# Same box savefig(bbox_inches='tight') uses, measured with a 1x1 renderer at
+# the output dpi so no full-size pixel buffer is allocated
+def tight_bbox_inches(fig, dpi):
+    original_dpi = fig.dpi
+    fig.dpi = dpi
+    try:
+        bbox = fig.get_tightbbox(RendererAgg(1, 1, dpi))
+    finally:
+        fig.dpi = original_dpi
+    return bbox.padded(plt.rcParams['savefig.pad_inches'])
+
+def save_figure_tiled(fig, filename, dpi=300, band_rows=256):
+    # Lay out once up front, then detach the engine: savefig redoes the layout
+    # for any attached engine (even the placeholder plt.tight_layout leaves
+    # behind) by drawing into a renderer the size of the whole image
+    layout_engine = fig.get_layout_engine()
+    if layout_engine is not None:
+        layout_engine.execute(fig)
+        fig._layout_engine = None
+
+    bbox = tight_bbox_inches(fig, dpi)
+    width = int(bbox.width * dpi)
+    height = int(bbox.height * dpi)
+
+    try:
+        _write_bands(fig, filename, bbox, width, height, dpi, band_rows)
+    finally:
+        if layout_engine is not None:
+            fig.set_layout_engine(layout_engine)
+
+def _write_bands(fig, filename, bbox, width, height, dpi, band_rows):
+    # Like savefig, takes either a path or a writable binary file
+    with cbook.open_file_cm(filename, 'wb') as f:
+        writer = PNGStreamWriter(f, width, height, dpi)
+        for top in range(0, height, band_rows):
+            bottom = min(height, top + band_rows)
+            # Bands are anchored to the bottom edge like Agg's own output and
+            # offset in whole pixels so edge snapping matches a full render;
+            # the tiny overshoot keeps int() truncation from dropping a pixel
+            y0 = bbox.y0 * dpi + (height - bottom)
+            band = Bbox([[bbox.x0, y0 / dpi],
+                         [bbox.x0 + (width + 1e-3) / dpi, (y0 + bottom - top + 1e-3) / dpi]])
+            buf = io.BytesIO()
+            fig.savefig(buf, format='rgba', dpi=dpi, bbox_inches=band)
+            writer.write_rows(np.frombuffer(buf.getbuffer(), dtype=np.uint8).reshape(bottom - top, width, 4))
+        writer.close()
+
+# Hybrid vector output (OUTPUT_FORMAT 'pdf' or 'svg'): artists too dense to
+# be worth keeping as vectors are rasterized at RASTER_DPI while text and
+# simple shapes stay vector. A single artist is dense above
+# RASTER_VERTEX_THRESHOLD vertices; the layer drawn beneath the text is
+# rasterized as a whole once it passes RASTER_LAYER_THRESHOLD. Adjacent
+# rasterized artists are merged into one image, so file size and viewer
+# render time stay bounded however much content a slide carries.
+OUTPUT_FORMAT = 'png'
+RASTER_DPI = 200
+RASTER_VERTEX_THRESHOLD = 1000
+RASTER_LAYER_THRESHOLD = 5000
+
+def _vertex_count(artist):
+    if isinstance(artist, Collection):
+        paths = artist.get_paths()
+        vertices = sum(len(path.vertices) for path in paths)
+        # A scatter is one marker path stamped at every offset
+        offsets = len(artist.get_offsets())
+        return vertices * offsets if len(paths) == 1 and offsets > 1 else vertices
+    if isinstance(artist, Line2D):
+        return len(artist.get_xydata())
+    if isinstance(artist, Patch):
+        return len(artist.get_path().vertices)
+    return 0
+
+def rasterize_dense_artists(fig, vertex_threshold=None, layer_threshold=None):
+    vertex_threshold = vertex_threshold or RASTER_VERTEX_THRESHOLD
+    layer_threshold = layer_threshold or RASTER_LAYER_THRESHOLD
+    rasterized = 0
+    for ax in fig.axes:
+        frame = {ax.patch, *ax.spines.values()}
+        counts = {a: _vertex_count(a) for a in ax.get_children() if a.get_visible() and a not in frame}
+        text_zorder = min((t.get_zorder() for t in ax.texts), default=float('inf'))
+        layer = [a for a, n in counts.items() if n and a.get_zorder() < text_zorder]
+        dense_layer = sum(counts[a] for a in layer) > layer_threshold
+        for artist, n in counts.items():
+            if n > vertex_threshold or (dense_layer and artist in layer):
+                artist.set_rasterized(True)
+                rasterized += 1
+    return rasterized
+
+# Output sinks. save_slide encodes every slide straight into OUTPUT_SINK:
+# DirectorySink writes the usual files, ZipSink and TarSink append one member
+# per slide to an archive and flush it, so with a stream as the target
+# (stdout, a socket's makefile('wb'), an HTTP response body) the first slides
+# are on the wire while later ones are still rendering. MemorySink keeps the
+# encoded bytes for callers embedding the renderer. Each sink records the
+# size of every slide it received in sizes.
+class DirectorySink:
+    def __init__(self, directory='.'):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.sizes = {}
+
+    @contextlib.contextmanager
+    def open(self, name):
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as f:
+            yield f
+        self.sizes[name] = os.path.getsize(path)
+
+    def close(self):
+        pass
+
+class MemorySink:
+    def __init__(self):
+        self.slides = {}
+        self.sizes = {}
+
+    @contextlib.contextmanager
+    def open(self, name):
+        buffer = io.BytesIO()
+        yield buffer
+        self.slides[name] = buffer.getvalue()
+        self.sizes[name] = len(self.slides[name])
+
+    def close(self):
+        pass
+
+# Archives take a path or an already open binary stream, which they leave
+# open; neither needs to be seekable
+class ArchiveSink:
+    def __init__(self, target):
+        self.owns_stream = isinstance(target, (str, os.PathLike))
+        self.stream = open(target, 'wb') if self.owns_stream else target
+        self.sizes = {}
+
+    def close(self):
+        self.archive.close()
+        self.stream.flush()
+        if self.owns_stream:
+            self.stream.close()
+
+class ZipSink(ArchiveSink):
+    def __init__(self, target):
+        super().__init__(target)
+        self.archive = zipfile.ZipFile(self.stream, 'w')
+
+    @contextlib.contextmanager
+    def open(self, name):
+        # PNGs are already deflated; svg and pdf still shrink
+        compression = zipfile.ZIP_STORED if name.endswith('.png') else zipfile.ZIP_DEFLATED
+        info = zipfile.ZipInfo(name, time.localtime()[:6])
+        info.compress_type = compression
+        with self.archive.open(info, 'w') as f:
+            yield f
+        self.sizes[name] = info.file_size
+        self.stream.flush()
+
+class TarSink(ArchiveSink):
+    def __init__(self, target):
+        super().__init__(target)
+        self.archive = tarfile.open(fileobj=self.stream, mode='w|')
+
+    @contextlib.contextmanager
+    def open(self, name):
+        # A tar header carries the member size, so each slide is buffered
+        buffer = io.BytesIO()
+        yield buffer
+        info = tarfile.TarInfo(name)
+        info.size = buffer.tell()
+        info.mtime = int(time.time())
+        buffer.seek(0)
+        self.archive.addfile(info, buffer)
+        self.sizes[name] = info.size
+        self.stream.flush()
+
+OUTPUT_SINK = DirectorySink()
+
+# Every builder finishes through here so output settings apply deck-wide
+def save_slide(fig, filename):
+    if RENDER_WORKER is not None:
+        # In a render worker the pixels go to the parent through shared memory
+        return RENDER_WORKER.hand_off(fig, filename)
+    if OUTPUT_FORMAT != 'png':
+        filename = os.path.splitext(filename)[0] + '.' + OUTPUT_FORMAT
+    with OUTPUT_SINK.open(filename) as f:
+        if OUTPUT_FORMAT != 'png':
+            rasterize_dense_artists(fig)
+            # dpi only sets the resolution of the rasterized parts here. No
+            # creation date and a fixed svg id salt, so an unchanged slide is
+            # written byte for byte the same (and keeps its published URL).
+            metadata = {'CreationDate': None} if OUTPUT_FORMAT == 'pdf' else {'Date': None}
+            with plt.rc_context({'svg.hashsalt': 'visuals'}):
+                fig.savefig(f, format=OUTPUT_FORMAT, dpi=RASTER_DPI, bbox_inches='tight', metadata=metadata)
+        elif BAND_ROWS:
+            save_figure_tiled(fig, f, dpi=OUTPUT_DPI, band_rows=BAND_ROWS)
+        elif SCENES is not None:
+            plt.imsave(f, render_slide_scene(fig, _slide_name(filename)), format='png', dpi=OUTPUT_DPI)
+        else:
+            pixels = rasterize_slide(fig, _slide_name(filename))
+            plt.imsave(f, pixels, format='png', dpi=OUTPUT_DPI)
+    if FINGERPRINTS is not None:
+        # Banded renders never have the whole slide in memory, so read those
+        # back (which needs a DirectorySink)
+        if BAND_ROWS:
+            with Image.open(os.path.join(OUTPUT_SINK.directory, filename)) as image:
+                pixels = np.asarray(image.convert('RGBA'))
+        elif SCENES is not None:
+            pixels = SCENES[_slide_name(filename)][1]
+        FINGERPRINTS[_slide_name(filename)] = slide_fingerprint(pixels)
+    plt.close(fig)
+    METRICS.inc('slide_render_bytes_written_total', OUTPUT_SINK.sizes[filename],
+                slide=_slide_name(filename), profile=RENDER_PROFILE)
+    return filename
+
+# Rendering metrics in the Prometheus text format. Recording is a dict update
+# under a lock, cheap enough to leave on for every render; scrape them from
+# /metrics (--metrics-port, or the watch server) or dump them with
+# --metrics-file for batch runs.
+RENDER_PROFILE = 'print'
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+class MetricsRegistry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.families = {}
+        self.values = {}
+
+    def describe(self, name, kind, help_text):
+        self.families[name] = (kind, help_text)
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.values[key] = value
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            buckets, total, count = self.values.get(key, ([0] * len(LATENCY_BUCKETS), 0, 0))
+            buckets = [n + (value <= bound) for n, bound in zip(buckets, LATENCY_BUCKETS)]
+            self.values[key] = (buckets, total + value, count + 1)
+
+    def exposition(self):
+        if resource is not None:
+            # ru_maxrss is kilobytes on Linux, bytes on macOS
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            self.set('process_peak_rss_bytes', peak if sys.platform == 'darwin' else peak * 1024)
+
+        with self.lock:
+            values = sorted(self.values.items())
+        lines = []
+        for name, (kind, help_text) in self.families.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (metric, labels), value in values:
+                if metric != name:
+                    continue
+                if kind == 'histogram':
+                    buckets, total, count = value
+                    for bound, n in zip(LATENCY_BUCKETS, buckets):
+                        lines.append(f"{name}_bucket{_format_labels(labels + (('le', bound),))} {n}")
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {count}")
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+        return '\n'.join(lines) + '\n'
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, v in labels)
+    return '{' + ','.join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + '}'
+
+# Watch mode re-executes module-level statements in this namespace; keep the
+# registry, and with it every counter and histogram, across those reloads
+METRICS = globals().get('METRICS') or MetricsRegistry()
+METRICS.describe('slide_render_seconds', 'histogram', "Time to build and encode a slide")
+METRICS.describe('slide_render_bytes_written_total', 'counter', "Encoded bytes written per slide")
+METRICS.describe('slide_render_errors_total', 'counter', "Slide builds that raised an exception")
+METRICS.describe('slide_render_cache_hits_total', 'counter', "Renders skipped because the slide was unchanged")
+METRICS.describe('slide_render_cache_misses_total', 'counter', "Slides that had to be rendered")
+METRICS.describe('slide_render_queue_depth', 'gauge', "Slides waiting to be rendered in the current batch")
+METRICS.describe('slide_render_in_progress', 'gauge', "Slides currently being rendered")
+METRICS.describe('slide_render_busy_seconds_total', 'counter', "Time spent rendering; rate() gives worker utilization")
+METRICS.describe('process_peak_rss_bytes', 'gauge', "Peak resident set size of the render process")
+
+# Registers a slide builder under its output name (concept_map.png ->
+# "concept_map") and records its latency and errors. Re-registering (as watch
+# mode does) replaces the builder but keeps its place in deck order, which is
+# why a module reload keeps the existing table too.
+SLIDES = globals().get('SLIDES') or {}
+
+def register_slide(name):
+    def register(builder):
+        @functools.wraps(builder)
+        def wrapper(*args, **kwargs):
+            METRICS.inc('slide_render_in_progress')
+            start = time.perf_counter()
+            try:
+                filename = builder(*args, **kwargs)
+            except Exception:
+                METRICS.inc('slide_render_errors_total', slide=name, profile=RENDER_PROFILE)
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                METRICS.inc('slide_render_in_progress', -1)
+                METRICS.inc('slide_render_busy_seconds_total', elapsed)
+            METRICS.observe('slide_render_seconds', elapsed, slide=name, profile=RENDER_PROFILE)
+            return filename
+        wrapper.slide_name = name
+        SLIDES[name] = wrapper
+        return wrapper
+    return register
+
+def _slide_name(filename):
+    return os.path.splitext(os.path.basename(filename))[0]
+
+def serve_metrics(port):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != '/metrics':
+                self.send_error(404)
+                return
+            _send_metrics(self)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('', port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def _send_metrics(handler):
+    body = METRICS.exposition().encode()
+    handler.send_response(200)
+    handler.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+    handler.send_header('Content-Length', str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+
 # Slide 2: Iceberg Diagram of Microaggressions
+@register_slide('iceberg_microaggressions')
 def create_iceberg_diagram():
     fig, ax = plt.subplots(figsize=(10, 8))
     
@@ -45,12 +489,10 @@ def create_iceberg_diagram():
     # Remove axes
     ax.axis('off')
     plt.tight_layout()
-    plt.savefig('iceberg_microaggressions.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return "iceberg_microaggressions.png"
+    return save_slide(fig, 'iceberg_microaggressions.png')
 
 # Slide 3: Three-column chart of microaggression types
+@register_slide('microaggression_types')
 def create_microaggression_types_chart():
     fig, ax = plt.subplots(figsize=(12, 8))
     ax.axis('off')
@@ -96,12 +538,10 @@ def create_microaggression_types_chart():
     fig.suptitle('Types of Microaggressions in the Workplace', fontsize=16, fontweight='bold', y=0.98)
     
     plt.tight_layout()
-    plt.savefig('microaggression_types.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return "microaggression_types.png"
+    return save_slide(fig, 'microaggression_types.png')
 
 # Slide 4: Timeline of microaggression research
+@register_slide('microaggression_timeline')
 def create_research_timeline():
     fig, ax = plt.subplots(figsize=(12, 6))
     
@@ -151,13 +591,10 @@ def create_research_timeline():
     fig.suptitle('Evolution of Microaggression Research', fontsize=16, fontweight='bold', y=0.95)
     
     plt.tight_layout()
-    plt.savefig('microaggression_timeline.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return "microaggression_timeline.png"
+    return save_slide(fig, 'microaggression_timeline.png')
 
 # Slide 5: Infographic showing ripple effects of microaggressions
-def create_ripple_effect_infographic():
+def draw_ripple_effect_infographic():
     fig, ax = plt.subplots(figsize=(10, 10))
     
     # Create circular ripples
@@ -165,10 +602,12 @@ def create_ripple_effect_infographic():
     ripple_radii = [1, 2, 3, 4]
     ripple_labels = ["MICROAGGRESSION\nEVENT", "INDIVIDUAL\nIMPACT", "TEAM\nEFFECT", "ORGANIZATIONAL\nCONSEQUENCES"]
     ripple_colors = [colors[i] for i in [0, 2, 4, 6]]
+    ripples = []
     
     for radius, label, color in zip(ripple_radii, ripple_labels, ripple_colors):
         circle = plt.Circle(center, radius, fill=True, alpha=0.2, color=color, edgecolor=color, linewidth=2)
         ax.add_patch(circle)
+        ripples.append(circle)
         
         if radius == 1:
             ax.text(center[0], center[1], label, ha='center', va='center', fontsize=10, fontweight='bold')
@@ -211,12 +650,15 @@ def create_ripple_effect_infographic():
     fig.suptitle('Ripple Effects of Workplace Microaggressions', fontsize=16, fontweight='bold', y=0.98)
     
     plt.tight_layout()
-    plt.savefig('microaggression_ripple_effects.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return "microaggression_ripple_effects.png"
+    return fig, ripples
+
+@register_slide('microaggression_ripple_effects')
+def create_ripple_effect_infographic():
+    fig, _ = draw_ripple_effect_infographic()
+    return save_slide(fig, 'microaggression_ripple_effects.png')
 
 # Slide 6: Testimonial quotes visualization
+@register_slide('microaggression_testimonials')
 def create_testimonial_quotes():
     fig, ax = plt.subplots(figsize=(12, 8))
     
@@ -248,12 +690,10 @@ def create_testimonial_quotes():
     ax.axis('off')
     
     plt.tight_layout()
-    plt.savefig('microaggression_testimonials.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return "microaggression_testimonials.png"
+    return save_slide(fig, 'microaggression_testimonials.png')
 
 # Slide 7: Workplace scene with speech bubbles showing common microaggressions
+@register_slide('workplace_microaggressions')
 def create_workplace_microaggression_scene():
     # This would be better with actual illustrations, but we'll create a simple diagram
     fig, ax = plt.subplots(figsize=(14, 8))
@@ -334,12 +774,10 @@ def create_workplace_microaggression_scene():
     ax.axis('off')
     
     plt.tight_layout()
-    plt.savefig('workplace_microaggressions.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return "workplace_microaggressions.png"
+    return save_slide(fig, 'workplace_microaggressions.png')
 
 # Slide 8: Reflection journal visualization
+@register_slide('reflection_journal')
 def create_reflection_journal():
     fig, ax = plt.subplots(figsize=(12, 8))
     
@@ -377,12 +815,10 @@ def create_reflection_journal():
     ax.axis('off')
     
     plt.tight_layout()
-    plt.savefig('reflection_journal.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return "reflection_journal.png"
+    return save_slide(fig, 'reflection_journal.png')
 
 # Slide 9: Concept map connecting course materials
+@register_slide('concept_map')
 def create_concept_map():
     # Create a network graph
     G = nx.Graph()
@@ -463,12 +899,10 @@ def create_concept_map():
     ax.axis('off')
     
     plt.tight_layout()
-    plt.savefig('concept_map.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return "concept_map.png"
+    return save_slide(fig, 'concept_map.png')
 
 # Slide 10: Decision tree for identifying microaggressions
+@register_slide('decision_tree')
 def create_decision_tree():
     fig, ax = plt.subplots(figsize=(12, 8))
     
@@ -536,44 +970,42 @@ def create_decision_tree():
         # Level 4 to 5
         (0.15, 0.4, 0.15, 0.25),
         (0.4, 0.4, 0.4, 0.25),
-       (0.6, 0.4, 0.6, 0.25),
-       (0.85, 0.4, 0.85, 0.25),
-       
-       # Level 5 to 6
-       (0.15, 0.25, 0.15, 0.15),
-       (0.4, 0.25, 0.4, 0.15),
-       (0.6, 0.25, 0.6, 0.15),
-       (0.85, 0.25, 0.85, 0.15)
-   ]
-   
-   # Draw connections
-for x1, y1, x2, y2 in connections:
-       ax.annotate("", 
-                  xy=(x2, y2), xycoords='data',
-                  xytext=(x1, y1), textcoords='data',
-                  arrowprops=dict(arrowstyle="->", connectionstyle="arc3,rad=0.1",
-                                  color='gray', alpha=0.7, linewidth=1))
-   
-   # Title
-fig.suptitle('Decision Tree for Identifying Potential Microaggressions', 
-               fontsize=16, fontweight='bold', y=0.98)
-   
-   # Note at bottom
-   ax.text(0.5, 0.05, "Note: This simplified decision tree is a starting point for recognition.\nAlways consider context, power dynamics, and individual experiences.", 
-          ha='center', fontsize=9, style='italic')
-   
-   # Remove axes
-   ax.set_xlim(0, 1)
-   ax.set_ylim(0, 1)
-   ax.axis('off')
-   
-   plt.tight_layout()
-   plt.savefig('decision_tree.png', dpi=300, bbox_inches='tight')
-   plt.close()
-   
-   return "decision_tree.png"
+        (0.6, 0.4, 0.6, 0.25),
+        (0.85, 0.4, 0.85, 0.25),
+        
+        # Level 5 to 6
+        (0.15, 0.25, 0.15, 0.15),
+        (0.4, 0.25, 0.4, 0.15),
+        (0.6, 0.25, 0.6, 0.15),
+        (0.85, 0.25, 0.85, 0.15)
+    ]
+    
+    # Draw connections
+    for x1, y1, x2, y2 in connections:
+        ax.annotate("", 
+                   xy=(x2, y2), xycoords='data',
+                   xytext=(x1, y1), textcoords='data',
+                   arrowprops=dict(arrowstyle="->", connectionstyle="arc3,rad=0.1",
+                                   color='gray', alpha=0.7, linewidth=1))
+    
+    # Title
+    fig.suptitle('Decision Tree for Identifying Potential Microaggressions', 
+                fontsize=16, fontweight='bold', y=0.98)
+    
+    # Note at bottom
+    ax.text(0.5, 0.05, "Note: This simplified decision tree is a starting point for recognition.\nAlways consider context, power dynamics, and individual experiences.", 
+           ha='center', fontsize=9, style='italic')
+    
+    # Remove axes
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.axis('off')
+    
+    plt.tight_layout()
+    return save_slide(fig, 'decision_tree.png')
 
 # Slide 11: Role-play scenarios with response strategies
+@register_slide('response_strategies')
 def create_response_strategies():
    fig, ax = plt.subplots(figsize=(12, 8))
    
@@ -624,12 +1056,10 @@ def create_response_strategies():
    ax.axis('off')
    
    plt.tight_layout()
-   plt.savefig('response_strategies.png', dpi=300, bbox_inches='tight')
-   plt.close()
-   
-   return "response_strategies.png"
+   return save_slide(fig, 'response_strategies.png')
 
 # Slide 12: Implementation roadmap for organizations
+@register_slide('implementation_roadmap')
 def create_implementation_roadmap():
    fig, ax = plt.subplots(figsize=(14, 8))
    
@@ -697,12 +1127,10 @@ def create_implementation_roadmap():
    ax.axis('off')
    
    plt.tight_layout()
-   plt.savefig('implementation_roadmap.png', dpi=300, bbox_inches='tight')
-   plt.close()
-   
-   return "implementation_roadmap.png"
+   return save_slide(fig, 'implementation_roadmap.png')
 
 # Slide 13: Personal development plan
+@register_slide('personal_development_plan')
 def create_personal_development_plan():
    fig, ax = plt.subplots(figsize=(12, 8))
    
@@ -789,13 +1217,10 @@ def create_personal_development_plan():
    ax.axis('off')
    
    plt.tight_layout()
-   plt.savefig('personal_development_plan.png', dpi=300, bbox_inches='tight')
-   plt.close()
-   
-   return "personal_development_plan.png"
+   return save_slide(fig, 'personal_development_plan.png')
 
 # Slide 14: Circular diagram showing continuous improvement cycle
-def create_continuous_improvement():
+def draw_continuous_improvement():
    fig, ax = plt.subplots(figsize=(10, 10))
    
    # Define the continuous improvement cycle stages
@@ -806,6 +1231,7 @@ def create_continuous_improvement():
    # Create the main circle
    circle = plt.Circle((0.5, 0.5), 0.3, facecolor='none', edgecolor='black', linewidth=2, alpha=0.7)
    ax.add_patch(circle)
+   stage_artists = []
    
    # Add stage labels along the circle
    for i, (stage, angle) in enumerate(zip(stages, angles)):
@@ -817,7 +1243,7 @@ def create_continuous_improvement():
        ax.add_patch(node_circle)
        
        # Add label
-       ax.text(x, y, stage, ha='center', va='center', fontsize=10, fontweight='bold')
+       label = ax.text(x, y, stage, ha='center', va='center', fontsize=10, fontweight='bold')
        
        # Add arrow to next stage
        next_angle = angles[(i + 1) % len(stages)]
@@ -834,11 +1260,12 @@ def create_continuous_improvement():
            [(x, y), (ctrl_x, ctrl_y), (next_x, next_y)],
            [plt.matplotlib.path.Path.MOVETO, plt.matplotlib.path.Path.CURVE3, plt.matplotlib.path.Path.CURVE3]
        )
-       arrow_patch = plt.matplotlib.patches.PathPatch(
-           arrow_path, facecolor='none', edgecolor='black', linewidth=1.5,
-           arrowstyle='->', connectionstyle='arc3,rad=0.3'
+       arrow_patch = plt.matplotlib.patches.FancyArrowPatch(
+           path=arrow_path, facecolor='none', edgecolor='black', linewidth=1.5,
+           arrowstyle='->', mutation_scale=15
        )
        ax.add_patch(arrow_patch)
+       stage_artists.append((node_circle, arrow_patch, label))
    
    # Add descriptions for each stage
    descriptions = [
@@ -873,33 +1300,1377 @@ def create_continuous_improvement():
    ax.axis('off')
    
    plt.tight_layout()
-   plt.savefig('continuous_improvement.png', dpi=300, bbox_inches='tight')
-   plt.close()
-   
-   return "continuous_improvement.png"
+   return fig, stage_artists
+
+@register_slide('continuous_improvement')
+def create_continuous_improvement():
+   fig, _ = draw_continuous_improvement()
+   return save_slide(fig, 'continuous_improvement.png')
 
 # Create all visuals and return a list of filenames
-def create_all_visuals():
-   visuals = [
-       create_iceberg_diagram(),                # Slide 2
-       create_microaggression_types_chart(),    # Slide 3
-       create_research_timeline(),              # Slide 4
-       create_ripple_effect_infographic(),      # Slide 5
-       create_testimonial_quotes(),             # Slide 6
-       create_workplace_microaggression_scene(),# Slide 7
-       create_reflection_journal(),             # Slide 8
-       create_concept_map(),                    # Slide 9
-       create_decision_tree(),                  # Slide 10
-       create_response_strategies(),            # Slide 11
-       create_implementation_roadmap(),         # Slide 12
-       create_personal_development_plan(),      # Slide 13
-       create_continuous_improvement()          # Slide 14
+def create_all_visuals(workers=None):
+   builders = [
+       create_iceberg_diagram,                  # Slide 2
+       create_microaggression_types_chart,      # Slide 3
+       create_research_timeline,                # Slide 4
+       create_ripple_effect_infographic,        # Slide 5
+       create_testimonial_quotes,               # Slide 6
+       create_workplace_microaggression_scene,  # Slide 7
+       create_reflection_journal,               # Slide 8
+       create_concept_map,                      # Slide 9
+       create_decision_tree,                    # Slide 10
+       create_response_strategies,              # Slide 11
+       create_implementation_roadmap,           # Slide 12
+       create_personal_development_plan,        # Slide 13
+       create_continuous_improvement            # Slide 14
    ]
+
+   if workers:
+       return render_parallel(builders, workers)
+
+   visuals = []
+   for i, builder in enumerate(builders):
+       METRICS.set('slide_render_queue_depth', len(builders) - i - 1)
+       visuals.append(builder())
    
    return visuals
 
+# Parallel rendering (--workers). The builders run in worker processes that
+# rasterize each slide into a block from a SharedBufferPool and send the
+# parent only a descriptor (block index, shape, dpi). The parent encodes the
+# PNG straight from that block into OUTPUT_SINK and hands the block back, so
+# pixels are never pickled or piped between processes. The pool's blocks are
+# allocated once, sized for the largest slide, and recycled for every slide;
+# a worker only takes a block once its slide is drawn and waits for one when
+# the encoder falls behind.
+SHARED_BLOCK_INCHES = (15, 11)   # largest slide (14x8, 12x10) plus tight-bbox padding
+RENDER_WORKER = None
+
+class SharedBufferPool:
+    def __init__(self, blocks, block_size, context=multiprocessing):
+        self.block_size = block_size
+        self.blocks = [shared_memory.SharedMemory(create=True, size=block_size) for _ in range(blocks)]
+        self.names = [block.name for block in self.blocks]
+        self.free = context.Queue()
+        for index in range(blocks):
+            self.free.put(index)
+
+    def view(self, index, height, width):
+        return np.ndarray((height, width, 4), dtype=np.uint8, buffer=self.blocks[index].buf)
+
+    def release(self, index):
+        self.free.put(index)
+
+    def close(self):
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+
+class RenderWorker:
+    def __init__(self, names, block_size, free, ready):
+        # Attached once per process, not per slide
+        self.blocks = [shared_memory.SharedMemory(name=name) for name in names]
+        self.block_size = block_size
+        self.free = free
+        self.ready = ready
+
+    def hand_off(self, fig, filename):
+        writer = BlockWriter(self, filename)
+        rasterizer = RASTERIZER_CHOICES.get(_slide_name(filename), 'agg')
+        try:
+            if rasterizer == 'agg':
+                fig.savefig(writer, format='rgba', dpi=OUTPUT_DPI, bbox_inches='tight')
+                # Still the renderer savefig drew into
+                height, width = fig.canvas.renderer.height, fig.canvas.renderer.width
+            else:
+                # The other rasterizers hand back their own buffer
+                pixels = RASTERIZERS[rasterizer](fig, OUTPUT_DPI)
+                writer.write(pixels)
+                height, width = pixels.shape[:2]
+        except Exception:
+            if writer.index is not None:
+                self.free.put(writer.index)
+            raise
+        finally:
+            plt.close(fig)
+        self.ready.put(('slide', filename, writer.index, height, width, OUTPUT_DPI))
+        return filename
+
+    def close(self):
+        for block in self.blocks:
+            block.close()
+
+# savefig draws the tight-cropped slide, then writes its whole RGBA buffer in
+# a single write: the only copy of the pixels, and inside the worker
+class BlockWriter(io.RawIOBase):
+    def __init__(self, worker, filename):
+        self.worker = worker
+        self.filename = filename
+        self.index = None
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = memoryview(data).cast('B')
+        if self.index is not None or len(data) > self.worker.block_size:
+            raise ValueError(f"{self.filename} does not fit a {self.worker.block_size}-byte shared block; "
+                             f"raise SHARED_BLOCK_INCHES")
+        self.index = self.worker.free.get()
+        self.worker.blocks[self.index].buf[:len(data)] = data
+        return len(data)
+
+def _render_worker(names, block_size, free, tasks, ready, settings):
+    global RENDER_WORKER
+    globals().update(settings)
+    RENDER_WORKER = RenderWorker(names, block_size, free, ready)
+    for name in iter(tasks.get, None):
+        ready.put(('start', name))
+        start = time.perf_counter()
+        try:
+            filename = SLIDES[name]()
+        except Exception:
+            ready.put(('error', name, time.perf_counter() - start, traceback.format_exc()))
+        else:
+            ready.put(('done', name, time.perf_counter() - start, filename))
+    RENDER_WORKER.close()
+
+# Same output and bookkeeping as save_slide, from pixels a worker rendered
+def _encode_shared(filename, pixels, dpi):
+    with OUTPUT_SINK.open(filename) as f:
+        plt.imsave(f, pixels, format='png', dpi=dpi)
+    if FINGERPRINTS is not None:
+        FINGERPRINTS[_slide_name(filename)] = slide_fingerprint(pixels)
+    METRICS.inc('slide_render_bytes_written_total', OUTPUT_SINK.sizes[filename],
+                slide=_slide_name(filename), profile=RENDER_PROFILE)
+
+def render_parallel(builders, workers, blocks=None):
+    context = multiprocessing.get_context()
+    block_size = 4 * int(np.ceil(SHARED_BLOCK_INCHES[0] * OUTPUT_DPI)) * int(np.ceil(SHARED_BLOCK_INCHES[1] * OUTPUT_DPI))
+    # One block per worker plus the one being encoded keeps every worker busy
+    pool = SharedBufferPool(blocks or workers + 1, block_size, context)
+    tasks, ready = context.Queue(), context.Queue()
+    for builder in builders:
+        tasks.put(builder.slide_name)
+    for _ in range(workers):
+        tasks.put(None)
+    settings = {name: globals()[name] for name in ('OUTPUT_DPI', 'RENDER_PROFILE', 'RASTERIZER_CHOICES')}
+    processes = [context.Process(target=_render_worker, daemon=True,
+                                 args=(pool.names, block_size, pool.free, tasks, ready, settings))
+                 for _ in range(workers)]
+    files = {}
+    try:
+        for process in processes:
+            process.start()
+        while len(files) < len(builders):
+            try:
+                message = ready.get(timeout=1)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    raise RuntimeError("Render workers exited before finishing the deck")
+                continue
+            kind, name = message[:2]
+            if kind == 'start':
+                METRICS.inc('slide_render_in_progress')
+            elif kind == 'slide':
+                _, filename, index, height, width, dpi = message
+                try:
+                    _encode_shared(filename, pool.view(index, height, width), dpi)
+                finally:
+                    pool.release(index)
+            else:
+                elapsed = message[2]
+                METRICS.inc('slide_render_in_progress', -1)
+                METRICS.inc('slide_render_busy_seconds_total', elapsed)
+                if kind == 'error':
+                    METRICS.inc('slide_render_errors_total', slide=name, profile=RENDER_PROFILE)
+                    raise RuntimeError(f"Rendering {name} failed in a worker:\n{message[3]}")
+                METRICS.observe('slide_render_seconds', elapsed, slide=name, profile=RENDER_PROFILE)
+                files[name] = message[3]
+                METRICS.set('slide_render_queue_depth', len(builders) - len(files))
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        pool.close()
+    return [files[builder.slide_name] for builder in builders]
+
+# Scene graph IR. record_scene lowers a slide into a flat, ordered list of
+# slotted nodes (shapes, connectors, labels, marker runs and rasters) in
+# output pixels, each with the graphics state it was drawn with. It does so
+# by drawing the figure through a recording renderer exactly as
+# savefig(bbox_inches='tight') would, with Agg measuring the text, so the
+# builders stay plain matplotlib. render_scene replays the nodes through Agg
+# and gives the same pixels as the figure. diff_scenes matches two scenes of
+# a slide node by node and returns the pixel regions covering everything
+# added, removed or restyled; render_scene then redraws only those regions
+# onto the previous image. Scenes serialize to JSON (dump_scene/load_scene)
+# so renders can be cached or farmed out without pickling live figures.
+SCENES = None      # slide name -> (scene, pixels) when rendering through scenes
+SCENE_DIR = None   # also write each slide's scene here as <slide>.scene.json
+
+def _path_data(path):
+    return path.vertices.tolist(), None if path.codes is None else path.codes.tolist()
+
+def _array(values, dtype=float):
+    return None if values is None else np.asarray(values, dtype=dtype)
+
+class Style:
+    __slots__ = ('rgb', 'alpha', 'forced_alpha', 'linewidth', 'dashes', 'capstyle', 'joinstyle',
+                 'antialiased', 'snap', 'hatch', 'hatch_color', 'hatch_linewidth', 'clip_rectangle', 'clip_path')
+
+    @classmethod
+    def from_gc(cls, gc):
+        style = cls()
+        style.rgb = [float(c) for c in gc.get_rgb()]
+        style.alpha = float(gc.get_alpha())
+        style.forced_alpha = bool(gc.get_forced_alpha())
+        style.linewidth = float(gc.get_linewidth())
+        offset, dashes = gc.get_dashes()
+        style.dashes = [float(offset or 0), None if dashes is None else [float(d) for d in dashes]]
+        style.capstyle = gc.get_capstyle()
+        style.joinstyle = gc.get_joinstyle()
+        style.antialiased = bool(gc.get_antialiased())
+        style.snap = gc.get_snap()
+        style.hatch = gc.get_hatch()
+        hatch_color = gc.get_hatch_color()
+        style.hatch_color = None if hatch_color is None else [float(c) for c in hatch_color]
+        style.hatch_linewidth = float(gc.get_hatch_linewidth())
+        clip = gc.get_clip_rectangle()
+        style.clip_rectangle = None if clip is None else [float(v) for v in clip.extents]
+        clip_path, affine = gc.get_clip_path()
+        style.clip_path = None if clip_path is None else _path_data(affine.transform_path(clip_path))
+        return style
+
+    def apply(self, gc, offset):
+        gc.set_alpha(self.alpha if self.forced_alpha else None)
+        gc.set_foreground(tuple(self.rgb), isRGBA=True)
+        gc.set_linewidth(self.linewidth)
+        gc.set_dashes(*self.dashes)
+        gc.set_capstyle(self.capstyle)
+        gc.set_joinstyle(self.joinstyle)
+        gc.set_antialiased(self.antialiased)
+        gc.set_snap(self.snap)
+        gc.set_hatch(self.hatch)
+        if self.hatch_color is not None:
+            gc.set_hatch_color(self.hatch_color)
+        gc.set_hatch_linewidth(self.hatch_linewidth)
+        if self.clip_rectangle is not None:
+            x0, y0, x1, y1 = self.clip_rectangle
+            gc.set_clip_rectangle(Bbox([[x0 + offset[0], y0 + offset[1]], [x1 + offset[0], y1 + offset[1]]]))
+        if self.clip_path is not None:
+            vertices, codes = self.clip_path
+            gc.set_clip_path(TransformedPath(Path(vertices, codes), Affine2D().translate(*offset)))
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        style = cls()
+        for name in cls.__slots__:
+            setattr(style, name, data[name])
+        return style
+
+# Every node has a style and an extent: the [x0, y0, x1, y1] pixel box it
+# can touch, padded for strokes and antialiasing and cut to its clip box
+class Node:
+    __slots__ = ('style', 'extent')
+
+    def to_dict(self):
+        data = {'kind': type(self).__name__, 'style': self.style.to_dict(), 'extent': self.extent}
+        for name in self.fields:
+            data[name] = self._encode(name, getattr(self, name))
+        return data
+
+    def _encode(self, name, value):
+        return value.tolist() if isinstance(value, np.ndarray) else value
+
+    @classmethod
+    def from_dict(cls, data):
+        node = cls.__new__(cls)
+        node.style = Style.from_dict(data['style'])
+        node.extent = data['extent']
+        for name in cls.fields:
+            setattr(node, name, data[name])
+        return node
+
+    def _gc(self, renderer, offset):
+        gc = renderer.new_gc()
+        self.style.apply(gc, offset)
+        return gc
+
+# A filled or closed path. Vertices are kept with the affine transform to
+# pixels they were drawn with, so Agg snaps them exactly as before.
+class Shape(Node):
+    __slots__ = fields = ('vertices', 'codes', 'transform', 'fill', 'simplify')
+
+    def draw(self, renderer, offset):
+        gc = self._gc(renderer, offset)
+        path = Path(_array(self.vertices), _array(self.codes, np.uint8))
+        path.should_simplify = self.simplify
+        renderer.draw_path(gc, path, Affine2D(_array(self.transform)).translate(*offset), self.fill)
+        gc.restore()
+
+# An open, unfilled path: lines, arrows, leaders
+class Connector(Shape):
+    __slots__ = ()  # same fields as Shape
+
+class Label(Node):
+    __slots__ = fields = ('text', 'x', 'y', 'angle', 'font', 'math')
+
+    def draw(self, renderer, offset):
+        gc = self._gc(renderer, offset)
+        renderer.draw_text(gc, self.x + offset[0], renderer.height - (self.y + offset[1]), self.text,
+                           FontProperties(**self.font), self.angle, ismath=self.math)
+        gc.restore()
+
+# One marker path stamped at each position, as Line2D markers are drawn
+class Markers(Node):
+    __slots__ = fields = ('vertices', 'codes', 'transform', 'positions', 'position_codes', 'fill')
+
+    def draw(self, renderer, offset):
+        gc = self._gc(renderer, offset)
+        renderer.draw_markers(gc, Path(_array(self.vertices), _array(self.codes, np.uint8)),
+                              Affine2D(_array(self.transform)),
+                              Path(_array(self.positions), _array(self.position_codes, np.uint8)),
+                              Affine2D().translate(*offset), self.fill)
+        gc.restore()
+
+class Raster(Node):
+    __slots__ = fields = ('x', 'y', 'pixels')
+
+    def draw(self, renderer, offset):
+        gc = self._gc(renderer, offset)
+        renderer.draw_image(gc, self.x + offset[0], self.y + offset[1], self.pixels)
+        gc.restore()
+
+    # Pixels are stored compressed rather than as nested lists
+    def _encode(self, name, value):
+        if name != 'pixels':
+            return super()._encode(name, value)
+        return {'shape': value.shape, 'data': base64.b64encode(zlib.compress(value.tobytes())).decode('ascii')}
+
+    @classmethod
+    def from_dict(cls, data):
+        pixels = data['pixels']
+        data = dict(data, pixels=np.frombuffer(zlib.decompress(base64.b64decode(pixels['data'])),
+                                               dtype=np.uint8).reshape(pixels['shape']))
+        return super().from_dict(data)
+
+NODE_TYPES = {cls.__name__: cls for cls in (Shape, Connector, Label, Markers, Raster)}
+
+class Scene:
+    __slots__ = ('width', 'height', 'dpi', 'nodes', '_keys')
+
+    def __init__(self, width, height, dpi, nodes):
+        self.width = width
+        self.height = height
+        self.dpi = dpi
+        self.nodes = nodes
+        self._keys = None
+
+    def keys(self):
+        if self._keys is None:
+            self._keys = [json.dumps(node.to_dict()) for node in self.nodes]
+        return self._keys
+
+    def draw(self, renderer, region=None):
+        offset = (0, 0) if region is None else (-region[0], -region[1])
+        for node in self.nodes:
+            if region is None or _overlaps(node.extent, region):
+                node.draw(renderer, offset)
+
+    def to_dict(self):
+        return {'width': self.width, 'height': self.height, 'dpi': self.dpi,
+                'nodes': [node.to_dict() for node in self.nodes]}
+
+    @classmethod
+    def from_dict(cls, data):
+        nodes = [NODE_TYPES[node['kind']].from_dict(node) for node in data['nodes']]
+        return cls(data['width'], data['height'], data['dpi'], nodes)
+
+def _overlaps(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+# Records instead of drawing; everything else (text metrics, unit
+# conversion, collections decomposed into paths) matches Agg
+class SceneRecorder(RendererBase):
+    def __init__(self, width, height, dpi):
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.dpi = dpi
+        self.nodes = []
+        self._metrics = RendererAgg(1, 1, dpi)
+
+    def get_canvas_width_height(self):
+        return self.width, self.height
+
+    def points_to_pixels(self, points):
+        return points * self.dpi / 72
+
+    def get_text_width_height_descent(self, s, prop, ismath):
+        return self._metrics.get_text_width_height_descent(s, prop, ismath)
+
+    def option_image_nocomposite(self):
+        return True
+
+    def _add(self, node, gc, bounds, pad):
+        node.style = Style.from_gc(gc)
+        # Miter joins reach up to twice the line width past the path
+        pad += 2 * self.points_to_pixels(node.style.linewidth) + 2
+        extent = [bounds[0] - pad, bounds[1] - pad, bounds[2] + pad, bounds[3] + pad]
+        if node.style.clip_rectangle is not None:
+            clip = node.style.clip_rectangle
+            extent = [max(extent[0], clip[0]), max(extent[1], clip[1]), min(extent[2], clip[2]), min(extent[3], clip[3])]
+        node.extent = [float(v) for v in extent]
+        self.nodes.append(node)
+
+    def draw_path(self, gc, path, transform, rgbFace=None):
+        vertices = transform.transform(path.vertices)
+        closed = path.codes is not None and Path.CLOSEPOLY in path.codes
+        node = Shape() if rgbFace is not None or closed or gc.get_hatch() else Connector()
+        node.vertices, node.codes, node.transform = path.vertices, path.codes, transform.get_matrix()
+        node.fill = None if rgbFace is None else [float(c) for c in rgbFace]
+        node.simplify = bool(path.should_simplify)
+        finite = vertices[np.isfinite(vertices).all(axis=1)]
+        if len(finite):
+            self._add(node, gc, [*finite.min(axis=0), *finite.max(axis=0)], 0)
+
+    def draw_markers(self, gc, marker_path, marker_trans, path, trans, rgbFace=None):
+        node = Markers()
+        node.vertices, node.codes = marker_path.vertices, marker_path.codes
+        node.transform = marker_trans.get_matrix()
+        node.positions, node.position_codes = trans.transform(path.vertices), path.codes
+        node.fill = None if rgbFace is None else [float(c) for c in rgbFace]
+        marker_extent = np.abs(marker_trans.transform(marker_path.vertices)).max() if len(marker_path.vertices) else 0
+        finite = node.positions[np.isfinite(node.positions).all(axis=1)]
+        if len(finite):
+            self._add(node, gc, [*finite.min(axis=0), *finite.max(axis=0)], marker_extent + 1)
+
+    def draw_text(self, gc, x, y, s, prop, angle, ismath=False, mtext=None):
+        # Text arrives in top-down coordinates (flipy); store it y-up like
+        # every other node
+        y = self.height - y
+        node = Label()
+        node.text, node.x, node.y, node.angle, node.math = s, float(x), float(y), float(angle), ismath
+        node.font = {'family': prop.get_family(), 'style': prop.get_style(), 'variant': prop.get_variant(),
+                     'weight': prop.get_weight(), 'stretch': prop.get_stretch(), 'size': prop.get_size(),
+                     'fname': prop.get_file(), 'math_fontfamily': prop.get_math_fontfamily()}
+        width, height, descent = self.get_text_width_height_descent(s, prop, ismath)
+        corners = np.array([[0, -descent], [width, -descent], [width, height - descent], [0, height - descent]])
+        corners = Affine2D().rotate_deg(angle).translate(x, y).transform(corners)
+        self._add(node, gc, [*corners.min(axis=0), *corners.max(axis=0)], 2)
+
+    def draw_image(self, gc, x, y, im, transform=None):
+        node = Raster()
+        node.x, node.y, node.pixels = float(x), float(y), np.array(im)
+        self._add(node, gc, [x, y, x + im.shape[1], y + im.shape[0]], 0)
+
+class SceneCanvas(FigureCanvasAgg):
+    # savefig(format='scene') lands here with dpi and the tight bbox applied
+    def print_scene(self, filename_or_obj, **kwargs):
+        width, height = self.get_width_height(physical=True)
+        recorder = SceneRecorder(width, height, self.figure.dpi)
+        self.figure.draw(recorder)
+        self.scene = Scene(width, height, self.figure.dpi, recorder.nodes)
+
+def record_scene(fig, dpi):
+    canvas = SceneCanvas(fig)
+    fig.savefig(io.BytesIO(), format='scene', dpi=dpi, bbox_inches='tight')
+    return canvas.scene
+
+# Pixel regions [x0, y0, x1, y1] to redraw, or None when the whole slide must
+# be rendered again. Regions start on even pixels: Agg rounds text positions
+# half to even, so only even shifts leave the glyphs where a full render
+# puts them.
+def diff_scenes(old, new):
+    if (old.width, old.height, old.dpi) != (new.width, new.height, new.dpi):
+        return None
+    extents = []
+    matcher = difflib.SequenceMatcher(None, old.keys(), new.keys(), autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != 'equal':
+            extents += [node.extent for node in old.nodes[i1:i2] + new.nodes[j1:j2]]
+    regions = []
+    for x0, y0, x1, y1 in extents:
+        region = [max(0, int(np.floor(x0 / 2)) * 2), max(0, int(np.floor(y0 / 2)) * 2),
+                  min(new.width, int(np.ceil(x1))), min(new.height, int(np.ceil(y1)))]
+        if region[0] >= region[2] or region[1] >= region[3]:
+            continue
+        # Fold in every region this one overlaps so nothing is drawn twice
+        for other in [r for r in regions if _overlaps(r, region)]:
+            regions.remove(other)
+            region = [min(region[0], other[0]), min(region[1], other[1]),
+                      max(region[2], other[2]), max(region[3], other[3])]
+        regions.append(region)
+    return regions
+
+# Top-down RGBA pixels like Agg's buffer; with regions, only those are drawn
+# again onto pixels (the previous render of the same size) in place
+def render_scene(scene, pixels=None, regions=None):
+    if pixels is None:
+        renderer = RendererAgg(scene.width, scene.height, scene.dpi)
+        scene.draw(renderer)
+        return np.array(renderer.buffer_rgba())
+    for x0, y0, x1, y1 in regions:
+        renderer = RendererAgg(x1 - x0, y1 - y0, scene.dpi)
+        scene.draw(renderer, (x0, y0, x1, y1))
+        pixels[scene.height - y1:scene.height - y0, x0:x1] = np.asarray(renderer.buffer_rgba())
+    return pixels
+
+def dump_scene(scene, f):
+    json.dump(scene.to_dict(), f)
+
+def load_scene(f):
+    return Scene.from_dict(json.load(f))
+
+# Used by save_slide with SCENES set: re-renders only what changed since the
+# slide's previous scene
+def render_slide_scene(fig, name):
+    scene = record_scene(fig, OUTPUT_DPI)
+    previous = SCENES.get(name)
+    regions = None if previous is None else diff_scenes(previous[0], scene)
+    if regions is None:
+        pixels = render_scene(scene)
+    else:
+        pixels = render_scene(scene, previous[1], regions)
+    SCENES[name] = scene, pixels
+    if SCENE_DIR:
+        with open(os.path.join(SCENE_DIR, f'{name}.scene.json'), 'w') as f:
+            dump_scene(scene, f)
+    return pixels
+
+# Rasterizer backends for png slides. Each rasterizer takes a finished slide
+# and returns its tight-cropped RGBA pixels; save_slide encodes them the same
+# way whichever drew them. Agg is the default; cairo and mplcairo are
+# alternatives when installed. --calibrate times every available rasterizer
+# on every slide, keeps only those whose pixels are identical to Agg's, and
+# stores the fastest per slide and render profile in RASTERIZER_FILE. Later
+# renders with the same profile and dpi pick that choice up automatically.
+# Cairo antialiases differently from Agg, so in practice no alternative
+# passes the identical-pixels check and calibration keeps Agg; the table only
+# changes if an installed rasterizer reproduces Agg exactly.
+RASTERIZER_FILE = 'slide_rasterizers.json'
+CALIBRATION_ROUNDS = 9
+CALIBRATION_MARGIN = 0.05   # an alternative must beat Agg by this fraction
+RASTERIZERS = {}
+RASTERIZER_CHOICES = {}   # slide name -> rasterizer for the current profile
+CALIBRATION = None        # slide name -> calibration result while calibrating
+
+def register_rasterizer(name):
+    def register(rasterize):
+        RASTERIZERS[name] = rasterize
+        return rasterize
+    return register
+
+# Takes the rgba buffer savefig writes and drops it; Agg's pixels are read
+# straight off the canvas instead
+class DiscardWriter(io.RawIOBase):
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return memoryview(data).nbytes
+
+@register_rasterizer('agg')
+def rasterize_agg(fig, dpi):
+    fig.savefig(DiscardWriter(), format='rgba', dpi=dpi, bbox_inches='tight')
+    return np.asarray(fig.canvas.buffer_rgba())
+
+# Any other matplotlib backend that prints rgba. The crop is measured with Agg
+# so the slide is framed exactly as the Agg render is.
+def _savefig_rasterizer(backend):
+    def rasterize(fig, dpi):
+        bbox = tight_bbox_inches(fig, dpi)
+        buf = io.BytesIO()
+        fig.savefig(buf, format='rgba', dpi=dpi, bbox_inches=bbox, backend=backend)
+        return np.frombuffer(buf.getbuffer(), dtype=np.uint8).reshape(int(bbox.height * dpi), int(bbox.width * dpi), 4)
+    return rasterize
+
+if backend_cairo is not None:
+    register_rasterizer('cairo')(_savefig_rasterizer('cairo'))
+if mplcairo is not None:
+    register_rasterizer('mplcairo')(_savefig_rasterizer('module://mplcairo.base'))
+
+# Used by save_slide for whole png slides
+def rasterize_slide(fig, name):
+    if CALIBRATION is not None:
+        CALIBRATION[name] = calibrate_slide(fig, OUTPUT_DPI)
+        return RASTERIZERS[CALIBRATION[name]['rasterizer']](fig, OUTPUT_DPI)
+    return RASTERIZERS[RASTERIZER_CHOICES.get(name, 'agg')](fig, OUTPUT_DPI)
+
+# Median of CALIBRATION_ROUNDS per rasterizer. A rasterizer that fails or
+# changes any pixel of the full-resolution RGBA output is timed but never
+# chosen (the regression fingerprint is too coarse to prove a slide
+# unchanged), and Agg stays unless the fastest alternative beats it by
+# CALIBRATION_MARGIN rather than by noise.
+def calibrate_slide(fig, dpi):
+    reference = np.array(rasterize_agg(fig, dpi))
+    seconds, rejected = {}, []
+    for name, rasterize in RASTERIZERS.items():
+        timings = []
+        try:
+            for _ in range(CALIBRATION_ROUNDS):
+                start = time.perf_counter()
+                pixels = rasterize(fig, dpi)
+                timings.append(time.perf_counter() - start)
+            identical = np.array_equal(reference, pixels)
+        except Exception:
+            traceback.print_exc()
+            identical = False
+        if timings:
+            seconds[name] = round(float(np.median(timings)), 4)
+        if not identical:
+            rejected.append(name)
+    rasterizer = min((name for name in seconds if name not in rejected), key=seconds.get)
+    if seconds[rasterizer] > seconds['agg'] * (1 - CALIBRATION_MARGIN):
+        rasterizer = 'agg'
+    return {'rasterizer': rasterizer, 'seconds': seconds, 'rejected': rejected}
+
+# The file maps profile -> {'dpi': ..., 'slides': {slide: result}}; choices
+# calibrated at another dpi, or naming a rasterizer that is not installed
+# here, fall back to Agg
+def load_rasterizer_choices(profile, dpi, path=RASTERIZER_FILE):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        calibrated = json.load(f).get(profile)
+    if not calibrated or calibrated['dpi'] != dpi:
+        return {}
+    return {name: result['rasterizer'] for name, result in calibrated['slides'].items()
+            if result['rasterizer'] in RASTERIZERS}
+
+def save_calibration(calibration, profile, dpi, path=RASTERIZER_FILE):
+    calibrated = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            calibrated = json.load(f)
+    previous = calibrated.get(profile, {})
+    slides = previous['slides'] if previous.get('dpi') == dpi else {}
+    slides.update(calibration)
+    calibrated[profile] = {'dpi': dpi, 'slides': slides}
+    _write_atomic(path, json.dumps(calibrated, indent=2, sort_keys=True).encode())
+
+# Animated exports of the cycle and ripple slides. The static parts are
+# rendered once: whatever is drawn beneath the animated artists becomes a
+# background restored at the start of every frame, and whatever is drawn
+# above them becomes a transparent overlay composited back on top. Each frame
+# then only draws the animated artists and is piped straight into the encoder
+# (ffmpeg for mp4, Pillow for gif and webp).
+ANIMATION_DPI = 100
+
+def _split_layers(fig, animated):
+    animated = set(animated)
+    order, foreground = [], []
+    for ax in fig.axes:
+        # Same stable zorder sort Axes.draw uses, which draws its patch first
+        draw_order = sorted((a for a in ax.get_children() if a is not ax.patch), key=lambda a: a.get_zorder())
+        first = next((i for i, a in enumerate(draw_order) if a in animated), None)
+        if first is None:
+            continue
+        order += [a for a in draw_order if a in animated]
+        foreground += [a for a in draw_order[first:] if a not in animated]
+    return order, foreground
+
+def _pixel_crop(fig, dpi, width, height):
+    bbox = tight_bbox_inches(fig, dpi)
+    left = max(0, int(bbox.x0 * dpi))
+    right = min(width, int(np.ceil(bbox.x1 * dpi)))
+    top = max(0, height - int(np.ceil(bbox.y1 * dpi)))
+    bottom = min(height, height - int(bbox.y0 * dpi))
+    # yuv420p needs even dimensions
+    right -= (right - left) % 2
+    bottom -= (bottom - top) % 2
+    return slice(top, bottom), slice(left, right)
+
+def export_animation(fig, animated, update, filename, duration=10, fps=30, dpi=None):
+    dpi = dpi or ANIMATION_DPI
+    fig.set_dpi(dpi)
+    canvas = FigureCanvasAgg(fig)
+    width, height = map(int, fig.bbox.size)
+    rows, cols = _pixel_crop(fig, dpi, width, height)
+    order, foreground = _split_layers(fig, animated)
+    static = [a for a in fig.get_children() if not isinstance(a, Axes)]
+    static += [a for ax in fig.axes for a in ax.get_children() if a not in order and a not in foreground]
+
+    # Background: everything drawn beneath the animated artists
+    for artist in order + foreground:
+        artist.set_visible(False)
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+
+    # Overlay: only what is drawn above them, on a transparent canvas
+    for artist in static:
+        artist.set_visible(False)
+    for artist in foreground:
+        artist.set_visible(True)
+    canvas.draw()
+    overlay = np.array(canvas.buffer_rgba())[rows, cols]
+    for artist in static + order:
+        artist.set_visible(True)
+
+    # Composite only the overlay's covered pixels (Agg's buffer is straight
+    # alpha). Frames are composited in place on the renderer's own buffer,
+    # which the next restore_region overwrites anyway, and cropped by the
+    # encoder, so no per-frame copy of the canvas is made.
+    covered = np.flatnonzero(overlay[..., 3])
+    overlay_rgb = overlay.reshape(-1, 4)[covered, :3].astype(np.uint16)
+    overlay_alpha = overlay.reshape(-1, 4)[covered, 3:].astype(np.uint16)
+    covered_rows, covered_cols = np.unravel_index(covered, overlay.shape[:2])
+    covered = (covered_rows + rows.start) * width + covered_cols + cols.start
+    pixels = np.asarray(canvas.buffer_rgba()).reshape(-1, 4)
+
+    def frames():
+        for n in range(int(round(duration * fps))):
+            update(n / fps)
+            canvas.restore_region(background)
+            for artist in order:
+                fig.draw_artist(artist)
+            under = pixels[covered, :3].astype(np.uint16)
+            pixels[covered, :3] = (overlay_rgb * overlay_alpha + under * (255 - overlay_alpha) + 127) // 255
+            yield pixels.reshape(height, width, 4)
+
+    try:
+        _encode_frames(frames(), filename, fps, rows, cols)
+    finally:
+        plt.close(fig)
+    return filename
+
+# Frames arrive as full RGBA canvases that are only valid until the next one
+# is requested; each encoder crops them to the slide's tight bounding box.
+def _encode_frames(frames, filename, fps, rows, cols):
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == '.mp4':
+        if not FFMpegWriter.isAvailable():
+            raise RuntimeError(f"ffmpeg ({plt.rcParams['animation.ffmpeg_path']}) is needed to write {filename}; "
+                               "install it or use --animation-format gif or webp")
+        frames = iter(frames)
+        first = next(frames)
+        height, width = first.shape[:2]
+        crop = f'crop={cols.stop - cols.start}:{rows.stop - rows.start}:{cols.start}:{rows.start}'
+        command = [plt.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+                   '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+                   '-vf', crop, '-c:v', 'libx264', '-preset', 'veryfast', '-pix_fmt', 'yuv420p', filename]
+        with subprocess.Popen(command, stdin=subprocess.PIPE) as ffmpeg:
+            ffmpeg.stdin.write(first.data)
+            for frame in frames:
+                ffmpeg.stdin.write(frame.data)
+            ffmpeg.stdin.close()
+        if ffmpeg.returncode:
+            raise RuntimeError(f"ffmpeg exited with status {ffmpeg.returncode} writing {filename}")
+    elif extension in ('.gif', '.webp'):
+        # Pillow pulls the remaining frames from the generator as it encodes.
+        # GIF frames are quantized with the fast octree rather than Pillow's
+        # default median cut, which would dominate the encode time.
+        images = (Image.fromarray(frame[rows, cols, :3]) for frame in frames)
+        if extension == '.gif':
+            images = (image.quantize(method=Image.Quantize.FASTOCTREE) for image in images)
+        next(images).save(filename, save_all=True, append_images=images,
+                          duration=round(1000 / fps), loop=0)
+    else:
+        raise ValueError(f"Unsupported animation format: {extension}")
+
+# Stages light up one after another, one pass per clip
+def animate_continuous_improvement(filename='continuous_improvement.mp4', duration=10, fps=30, dpi=None):
+    fig, stage_artists = draw_continuous_improvement()
+
+    def update(t):
+        active = min(int(t / duration * len(stage_artists)), len(stage_artists) - 1)
+        for i, (node, arrow, label) in enumerate(stage_artists):
+            lit = i == active
+            node.set_alpha(0.95 if lit else 0.25)
+            node.set_linewidth(3 if lit else 1)
+            arrow.set_alpha(1 if lit else 0.25)
+            label.set_alpha(1 if lit else 0.4)
+
+    animated = [artist for stage in stage_artists for artist in stage]
+    return export_animation(fig, animated, update, filename, duration, fps, dpi)
+
+# Rings expand outward from the event, each starting a little after the one
+# inside it and easing out to its final radius
+def animate_ripple_effect_infographic(filename='microaggression_ripple_effects.mp4', duration=10, fps=30, dpi=None):
+    fig, ripples = draw_ripple_effect_infographic()
+    radii = [ripple.get_radius() for ripple in ripples]
+
+    def update(t):
+        for i, (ripple, radius) in enumerate(zip(ripples, radii)):
+            progress = min(max((t / duration - 0.15 * i) / 0.25, 0), 1)
+            ripple.set_radius(radius * (1 - (1 - progress) ** 2))
+
+    return export_animation(fig, ripples, update, filename, duration, fps, dpi)
+
+ANIMATIONS = {
+    'continuous_improvement': animate_continuous_improvement,
+    'microaggression_ripple_effects': animate_ripple_effect_infographic,
+}
+
+# Visual regression checks. Every PNG a builder saves is reduced to a
+# fingerprint: a 64-bit hash of each HASH_TILE-square tile of its
+# full-resolution RGBA pixels, plus its luminance box-filtered down by
+# FINGERPRINT_SCALE. A thumbnail tile of FINGERPRINT_TILE pixels covers
+# exactly one hashed tile. --update-fingerprints stores them, --check
+# compares a fresh render against the stored ones: any tile whose hash
+# differs is flagged, so colour-only and antialiasing changes count too. The
+# thumbnail only grades them, counting the tiles where some thumbnail pixel
+# moved by more than REGRESSION_TOLERANCE grey levels, and backs the diff
+# heatmap drawn for slides with flagged tiles.
+FINGERPRINT_FILE = 'slide_fingerprints.npz'
+FINGERPRINT_SCALE = 8
+FINGERPRINT_TILE = 8
+HASH_TILE = FINGERPRINT_SCALE * FINGERPRINT_TILE
+REGRESSION_TOLERANCE = 2
+FINGERPRINTS = None
+
+# One odd multiplier per byte of a full-resolution tile; sums wrap modulo 2**64
+TILE_WEIGHTS = (np.arange(1, HASH_TILE ** 2 * 4 + 1, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)) | np.uint64(1)
+
+def slide_fingerprint(pixels):
+    luma = np.asarray(Image.fromarray(pixels).convert('L').reduce(FINGERPRINT_SCALE))
+    height, width = pixels.shape[:2]
+    rows, cols = -(-height // HASH_TILE), -(-width // HASH_TILE)
+    hashes = np.empty((rows, cols), dtype=np.uint64)
+    # One strip of tiles at a time, padded with white, so the widened copy
+    # stays a few megabytes even for poster-size slides
+    strip = np.empty((HASH_TILE, cols * HASH_TILE, 4), dtype=np.uint8)
+    for row in range(rows):
+        band = pixels[row * HASH_TILE:(row + 1) * HASH_TILE]
+        strip.fill(255)
+        strip[:len(band), :width] = band
+        tiles = strip.reshape(HASH_TILE, cols, HASH_TILE * 4).swapaxes(0, 1).reshape(cols, -1)
+        hashes[row] = (tiles.astype(np.uint64) * TILE_WEIGHTS).sum(axis=-1)
+    return luma, hashes
+
+def _tiles(luma):
+    # Pad with white to whole tiles and view as (rows, cols, tile pixels)
+    luma = np.pad(luma, ((0, -luma.shape[0] % FINGERPRINT_TILE), (0, -luma.shape[1] % FINGERPRINT_TILE)),
+                  constant_values=255)
+    rows, cols = luma.shape[0] // FINGERPRINT_TILE, luma.shape[1] // FINGERPRINT_TILE
+    return luma.reshape(rows, FINGERPRINT_TILE, cols, FINGERPRINT_TILE).swapaxes(1, 2).reshape(rows, cols, -1)
+
+def load_fingerprints(path=FINGERPRINT_FILE):
+    if not os.path.exists(path):
+        return {}
+    with np.load(path) as data:
+        names = {key.rsplit('.', 1)[0] for key in data.files}
+        return {name: (data[f'{name}.luma'], data[f'{name}.tiles']) for name in names}
+
+def save_fingerprints(fingerprints, path=FINGERPRINT_FILE):
+    arrays = {}
+    for name, (luma, hashes) in fingerprints.items():
+        arrays[f'{name}.luma'] = luma
+        arrays[f'{name}.tiles'] = hashes
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    _write_atomic(path, buffer.getvalue())
+
+# Boolean (rows, cols) mask of tiles whose full-resolution pixels changed, or
+# None if the slide changed size
+def compare_fingerprints(old, new):
+    (old_luma, old_hashes), (new_luma, new_hashes) = old, new
+    if old_luma.shape != new_luma.shape:
+        return None
+    return old_hashes != new_hashes
+
+# The changed tiles that also moved by more than REGRESSION_TOLERANCE in the
+# thumbnail, i.e. the ones visible at a glance
+def visible_changes(old, new, changed):
+    (old_luma, _), (new_luma, _) = old, new
+    visible = np.zeros_like(changed)
+    candidates = np.nonzero(changed)
+    diff = np.abs(_tiles(new_luma)[candidates].astype(np.int16) - _tiles(old_luma)[candidates])
+    visible[candidates] = diff.max(axis=-1) > REGRESSION_TOLERANCE
+    return visible
+
+# The new slide faded to grey, with the luminance difference drawn on the
+# flagged tiles only. Flagged tiles start from a dark palette entry so that
+# changes the thumbnail cannot see still show up.
+def write_diff_heatmap(filename, old, new, changed):
+    (old_luma, _), (new_luma, _) = old, new
+    height, width = new_luma.shape
+    flagged = np.repeat(np.repeat(changed, FINGERPRINT_TILE, 0), FINGERPRINT_TILE, 1)[:height, :width]
+    heatmap = np.repeat((new_luma // 2 + 128)[..., None], 3, axis=-1)
+    diff = np.abs(new_luma[flagged].astype(np.int16) - old_luma[flagged])
+    palette = (plt.get_cmap('inferno')(np.arange(256))[:, :3] * 255).astype(np.uint8)
+    heatmap[flagged] = palette[np.clip(diff * 4, 32, 255)]
+    Image.fromarray(heatmap).save(filename)
+    return filename
+
+def check_fingerprints(fingerprints, path=FINGERPRINT_FILE):
+    baseline = load_fingerprints(path)
+    regressions = []
+    for name, new in fingerprints.items():
+        if name not in baseline:
+            print(f"{name}: no stored fingerprint")
+            regressions.append(name)
+            continue
+        changed = compare_fingerprints(baseline[name], new)
+        if changed is None:
+            print(f"{name}: size changed")
+        elif changed.any():
+            heatmap = write_diff_heatmap(f'{name}.diff.png', baseline[name], new, changed)
+            visible = visible_changes(baseline[name], new, changed)
+            print(f"{name}: {changed.sum()} of {changed.size} tiles changed "
+                  f"({visible.sum()} beyond {REGRESSION_TOLERANCE} grey levels), see {heatmap}")
+        else:
+            continue
+        regressions.append(name)
+    return regressions
+
+# Publishing for the web app, which serves public/ with express.static. Each
+# slide is copied into public/slides/ under a name carrying a hash of its
+# content, and public/slides.json maps slide names to those URLs. A slide
+# that did not change keeps its URL, so the server marks /slides/ immutable
+# and only the manifest is revalidated. Everything is written under a
+# temporary name and renamed into place, so the server never sees a partial
+# file; images a newer render superseded stay put for pages that still hold
+# the previous manifest.
+PUBLISH_DIR = 'public'
+
+def _write_atomic(path, data):
+    temporary = f'{path}.{os.getpid()}.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(data)
+    os.replace(temporary, path)
+
+def publish_slides(files, directory=PUBLISH_DIR):
+    os.makedirs(os.path.join(directory, 'slides'), exist_ok=True)
+    manifest_path = os.path.join(directory, 'slides.json')
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    published = 0
+    for filename in files:
+        with open(filename, 'rb') as f:
+            data = f.read()
+        stem, extension = os.path.splitext(os.path.basename(filename))
+        hashed = f'{stem}.{hashlib.sha256(data).hexdigest()[:16]}{extension}'
+        path = os.path.join(directory, 'slides', hashed)
+        if not os.path.exists(path):
+            _write_atomic(path, data)
+            published += 1
+        manifest[_slide_name(filename)] = f'/slides/{hashed}'
+    _write_atomic(manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode())
+    return manifest_path, published
+
+# Watch mode: keep the interpreter warm, re-render only the slides whose
+# builders (or the module-level names they depend on) changed and push the
+# new images to a live preview page. Previews render at a lower dpi so an
+# edit shows up in well under a second.
+PREVIEW_DPI = 100
+
+PREVIEW_PAGE = b"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Slide preview</title>
+    <style>
+        body { font-family: sans-serif; background: #eee; margin: 20px; }
+        figure { background: white; margin: 0 0 20px; padding: 10px; }
+        img { max-width: 100%; }
+        .error { color: #b00; white-space: pre-wrap; }
+    </style>
+</head>
+<body>
+    <div id="slides"></div>
+    <script>
+        const events = new EventSource('/events');
+        events.onmessage = (event) => {
+            const update = JSON.parse(event.data);
+            let slide = document.getElementById(update.file);
+            if (!slide) {
+                slide = document.createElement('figure');
+                slide.id = update.file;
+                slide.innerHTML = '<img><figcaption></figcaption><div class="error"></div>';
+                document.getElementById('slides').appendChild(slide);
+            }
+            slide.querySelector('figcaption').textContent = update.file;
+            slide.querySelector('.error').textContent = update.error || '';
+            if (!update.error) {
+                slide.querySelector('img').src = '/slides/' + update.file + '?v=' + update.version;
+            }
+        };
+    </script>
+</body>
+</html>
+"""
+
+class SlidePreview:
+    def __init__(self, directory):
+        self.directory = directory
+        self.versions = {}
+        self.errors = {}
+        self.updated = threading.Condition()
+
+    def publish(self, filename, error=None):
+        with self.updated:
+            self.versions[filename] = self.versions.get(filename, 0) + 1
+            self.errors[filename] = error
+            self.updated.notify_all()
+
+    def serve(self, port):
+        preview = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/':
+                    self._send(PREVIEW_PAGE, 'text/html; charset=utf-8')
+                elif self.path == '/events':
+                    self._stream_events()
+                elif self.path == '/metrics':
+                    _send_metrics(self)
+                elif self.path.startswith('/slides/'):
+                    filename = self.path[len('/slides/'):].split('?')[0]
+                    # Only files the watcher rendered are served
+                    if filename not in preview.versions:
+                        self.send_error(404)
+                        return
+                    with open(os.path.join(preview.directory, filename), 'rb') as f:
+                        self._send(f.read(), 'image/png')
+                else:
+                    self.send_error(404)
+
+            def _send(self, body, content_type):
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Cache-Control', 'no-store')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _stream_events(self):
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-store')
+                self.end_headers()
+                seen = {}
+                try:
+                    while True:
+                        with preview.updated:
+                            preview.updated.wait_for(lambda: preview.versions != seen, timeout=15)
+                            current = dict(preview.versions)
+                            errors = dict(preview.errors)
+                        changed = [f for f, version in current.items() if seen.get(f) != version]
+                        if not changed:
+                            self.wfile.write(b': keepalive\n\n')
+                        for filename in changed:
+                            update = {'file': filename, 'version': current[filename], 'error': errors[filename]}
+                            self.wfile.write(f"data: {json.dumps(update)}\n\n".encode())
+                        self.wfile.flush()
+                        seen = current
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+def _is_main_guard(node):
+    return (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+            and isinstance(node.test.left, ast.Name) and node.test.left.id == '__name__')
+
+# Names a top-level statement defines; statements that bind nothing (such as
+# plt.style.use) are tracked together under '<module>'
+def _bound_names(node):
+    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+        return {node.name}
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return {(alias.asname or alias.name).split('.')[0] for alias in node.names}
+    if isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        return {n.id for target in targets for n in ast.walk(target) if isinstance(n, ast.Name)}
+    return set()
+
+def _source_digests(tree, source):
+    lines = source.splitlines(keepends=True)
+    digests = {}
+    for node in tree.body:
+        if _is_main_guard(node):
+            continue
+        start = min([node.lineno] + [d.lineno for d in getattr(node, 'decorator_list', [])])
+        segment = ''.join(lines[start - 1:node.end_lineno])
+        for name in _bound_names(node) or {'<module>'}:
+            digests[name] = hashlib.sha1((digests.get(name, '') + segment).encode()).hexdigest()
+    return digests
+
+def _builder_names(tree):
+    return [node.name for node in tree.body
+            if isinstance(node, ast.FunctionDef) and node.name.startswith('create_')
+            and node.name != 'create_all_visuals']
+
+# Global names a function (or every method of a class) refers to
+def _global_refs(value):
+    if isinstance(value, type):
+        functions = [v for v in vars(value).values() if isinstance(v, types.FunctionType)]
+    else:
+        functions = [getattr(value, '__wrapped__', value)]
+    names = set()
+    codes = [f.__code__ for f in functions]
+    while codes:
+        code = codes.pop()
+        names.update(code.co_names)
+        codes.extend(c for c in code.co_consts if isinstance(c, types.CodeType))
+    return names
+
+# Builders affected by a set of changed names, following helper functions
+# transitively (a change to tight_bbox_inches reaches every builder through
+# save_slide)
+def _affected_builders(namespace, builders, changed):
+    affected = set(changed)
+    dependents = {name: _global_refs(value) for name, value in namespace.items()
+                  if isinstance(value, (types.FunctionType, type)) and getattr(value, '__module__', None) == namespace['__name__']}
+    grew = True
+    while grew:
+        grew = False
+        for name, refs in dependents.items():
+            if name not in affected and refs & affected:
+                affected.add(name)
+                grew = True
+    return [name for name in builders if name in affected]
+
+def _render_builders(namespace, builders, settings, preview):
+    for i, name in enumerate(builders):
+        # Re-executing the module resets these, so apply them every time
+        namespace.update(settings)
+        METRICS.set('slide_render_queue_depth', len(builders) - i - 1)
+        start = time.perf_counter()
+        # Failures go under the slide's file name too, so the next successful
+        # render replaces the error in the same preview panel
+        filename = getattr(namespace[name], 'slide_name', name) + '.png'
+        try:
+            filename = namespace[name]()
+        except Exception:
+            traceback.print_exc()
+            plt.close('all')
+            preview.publish(filename, error=traceback.format_exc())
+            continue
+        preview.publish(filename)
+        print(f"Rendered {filename} in {time.perf_counter() - start:.2f}s")
+
+# None while the file is missing, as it briefly is when an editor saves by
+# renaming a new copy over it
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+# Unchanged slides are reused as-is, which is what the cache metrics count
+def _count_cache(namespace, all_builders, rendered, profile):
+    for name in all_builders:
+        counter = 'slide_render_cache_misses_total' if name in rendered else 'slide_render_cache_hits_total'
+        METRICS.inc(counter, slide=getattr(namespace[name], 'slide_name', name), profile=profile)
+
+def watch_slides(path, port=8000, dpi=PREVIEW_DPI, profile='preview', interval=0.1):
+    namespace = globals()
+    # Slides go through scenes, so an edit only redraws the regions it changed
+    settings = {'OUTPUT_DPI': dpi, 'RENDER_PROFILE': profile, 'SCENES': {}}
+    preview = SlidePreview(os.getcwd())
+    preview.serve(port)
+    print(f"Previewing slides at http://127.0.0.1:{port}/ (Ctrl+C to stop)")
+
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    tree = ast.parse(source)
+    digests = _source_digests(tree, source)
+    builders = _builder_names(tree)
+    _count_cache(namespace, builders, builders, profile)
+    _render_builders(namespace, builders, settings, preview)
+
+    signature = _file_signature(path)
+    while True:
+        time.sleep(interval)
+        if _file_signature(path) == signature:
+            continue
+        # Wait for the editor to finish writing, and for the file to be back
+        # in place, before reading it
+        while True:
+            current = _file_signature(path)
+            if current is not None and current == signature:
+                break
+            signature = current
+            time.sleep(interval / 2)
+
+        try:
+            with open(path, encoding='utf-8') as f:
+                source = f.read()
+        except FileNotFoundError:
+            continue
+        try:
+            tree = ast.parse(source, path)
+        except SyntaxError:
+            traceback.print_exc()
+            continue
+
+        new_digests = _source_digests(tree, source)
+        changed = {name for name, digest in new_digests.items() if digests.get(name) != digest}
+        digests = new_digests
+        if not changed:
+            continue
+
+        # Re-execute only the changed definitions in the warm namespace; a
+        # change to an unnamed module-level statement reloads everything
+        all_builders = builders = _builder_names(tree)
+        if '<module>' in changed:
+            statements = [node for node in tree.body if not _is_main_guard(node)]
+        else:
+            statements = [node for node in tree.body if _bound_names(node) & changed]
+        try:
+            exec(compile(ast.Module(body=statements, type_ignores=[]), path, 'exec'), namespace)
+        except Exception:
+            traceback.print_exc()
+            continue
+
+        if '<module>' not in changed:
+            builders = _affected_builders(namespace, builders, changed)
+        _count_cache(namespace, all_builders, builders, profile)
+        _render_builders(namespace, builders, settings, preview)
+
 # Run the function to create all visuals
-visual_files = create_all_visuals()
-print("Created the following visual files:")
-for i, file in enumerate(visual_files):
-   print(f"Slide {i+2}: {file}")
\ No newline at end of file
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(description="Render the presentation visuals")
+   parser.add_argument('--dpi', type=int, help=f"output resolution (default {OUTPUT_DPI}, {PREVIEW_DPI} when watching)")
+   parser.add_argument('--band-rows', type=int, default=BAND_ROWS,
+                       help="rasterize in horizontal bands of this many pixel rows to bound peak memory")
+   parser.add_argument('--format', choices=['png', 'pdf', 'svg'], default=OUTPUT_FORMAT,
+                       help="output format; pdf and svg rasterize dense artists and keep text as vectors")
+   parser.add_argument('--raster-dpi', type=int, default=RASTER_DPI,
+                       help="resolution of rasterized artists in pdf/svg output")
+   parser.add_argument('--animate', nargs='+', choices=sorted(ANIMATIONS), metavar='SLIDE',
+                       help=f"export animated versions of these slides instead ({', '.join(sorted(ANIMATIONS))})")
+   parser.add_argument('--animation-format', choices=['mp4', 'gif', 'webp'], default='mp4')
+   parser.add_argument('--duration', type=float, default=10, help="animation length in seconds")
+   parser.add_argument('--fps', type=int, default=30, help="animation frame rate")
+   parser.add_argument('--watch', action='store_true',
+                       help="re-render slides as this file changes and serve a live preview page")
+   parser.add_argument('--port', type=int, default=8000, help="preview server port for --watch")
+   parser.add_argument('--profile', help="render profile label for metrics (default print, preview when watching)")
+   parser.add_argument('--metrics-port', type=int, help="serve Prometheus metrics on this port at /metrics")
+   parser.add_argument('--metrics-file', help="write Prometheus metrics to this file when rendering finishes")
+   parser.add_argument('--check', action='store_true',
+                       help="compare the rendered slides against the stored fingerprints and write diff heatmaps")
+   parser.add_argument('--update-fingerprints', action='store_true',
+                       help="store fingerprints of the rendered slides as the new reference")
+   parser.add_argument('--fingerprints', default=FINGERPRINT_FILE, help="fingerprint file for --check")
+   parser.add_argument('--publish', nargs='?', const=PUBLISH_DIR, metavar='DIR',
+                       help=f"copy the slides into DIR/slides under content-hashed names (default {PUBLISH_DIR})")
+   parser.add_argument('--sink', choices=['directory', 'zip', 'tar'], default='directory',
+                       help="write the slides as files, or append each to a zip/tar archive as soon as it is encoded")
+   parser.add_argument('--output', help="archive path, or - to stream it to stdout (default slides.zip/slides.tar)")
+   parser.add_argument('--scene-dir', help="render through the scene graph and save each slide's scene here as JSON")
+   parser.add_argument('--render-scenes', nargs='+', metavar='SCENE',
+                       help="render saved .scene.json files to png instead of running the builders")
+   parser.add_argument('--workers', type=int, help="render in this many worker processes, sharing pixels through shared memory")
+   parser.add_argument('--calibrate', action='store_true',
+                       help=f"time every available rasterizer ({', '.join(RASTERIZERS)}) on every slide "
+                            "and store the fastest whose output is pixel-identical to Agg's; "
+                            "cairo backends never are, so this normally keeps Agg")
+   parser.add_argument('--rasterizers', default=RASTERIZER_FILE,
+                       help="per-slide rasterizer choices, written by --calibrate and read by every png render")
+   args = parser.parse_args()
+   if (args.check or args.update_fingerprints) and args.format != 'png':
+      parser.error("--check and --update-fingerprints need png output")
+   if args.scene_dir and (args.workers or args.format != 'png' or args.band_rows):
+      parser.error("--scene-dir renders whole png slides in this process")
+   if args.calibrate and (args.workers or args.format != 'png' or args.band_rows or args.scene_dir):
+      parser.error("--calibrate times whole png slides in this process")
+   if args.workers and (args.format != 'png' or args.band_rows):
+      parser.error("--workers renders whole png slides and does not combine with --format or --band-rows")
+   if args.sink != 'directory' and (args.publish or (args.band_rows and (args.check or args.update_fingerprints))):
+      parser.error("--publish, and fingerprints of banded renders, read the slides back and need --sink directory")
+   BAND_ROWS = args.band_rows
+   if args.metrics_port:
+      serve_metrics(args.metrics_port)
+
+   if args.watch:
+      try:
+         watch_slides(os.path.abspath(__file__), port=args.port, dpi=args.dpi or PREVIEW_DPI,
+                      profile=args.profile or 'preview')
+      except KeyboardInterrupt:
+         pass
+      raise SystemExit
+
+   if args.animate:
+      for name in args.animate:
+         start = time.perf_counter()
+         filename = ANIMATIONS[name](f"{name}.{args.animation_format}", duration=args.duration,
+                                     fps=args.fps, dpi=args.dpi)
+         print(f"Created {filename} in {time.perf_counter() - start:.2f}s")
+      raise SystemExit
+
+   if args.render_scenes:
+      for path in args.render_scenes:
+         with open(path) as f:
+            scene = load_scene(f)
+         filename = os.path.basename(path).replace('.scene.json', '') + '.png'
+         plt.imsave(filename, render_scene(scene), format='png', dpi=scene.dpi)
+         print(f"Rendered {filename} from {path}")
+      raise SystemExit
+
+   OUTPUT_DPI = args.dpi or OUTPUT_DPI
+   OUTPUT_FORMAT = args.format
+   RASTER_DPI = args.raster_dpi
+   RENDER_PROFILE = args.profile or RENDER_PROFILE
+   if args.check or args.update_fingerprints:
+      FINGERPRINTS = {}
+   if args.calibrate:
+      CALIBRATION = {}
+   else:
+      RASTERIZER_CHOICES = load_rasterizer_choices(RENDER_PROFILE, OUTPUT_DPI, args.rasterizers)
+   if args.scene_dir:
+      os.makedirs(args.scene_dir, exist_ok=True)
+      SCENES, SCENE_DIR = {}, args.scene_dir
+   if args.sink != 'directory':
+      output = args.output or f'slides.{args.sink}'
+      if output == '-':
+         output = sys.stdout.buffer
+         # Keep the progress messages out of the archive
+         sys.stdout = sys.stderr
+      OUTPUT_SINK = (ZipSink if args.sink == 'zip' else TarSink)(output)
+   elif args.output:
+      OUTPUT_SINK = DirectorySink(args.output)
+   try:
+      visual_files = create_all_visuals(workers=args.workers)
+   finally:
+      # Finish the archive even if a builder raised, so the slides already
+      # streamed still arrive as a readable zip or tar
+      OUTPUT_SINK.close()
+   print("Created the following visual files:")
+   for i, file in enumerate(visual_files):
+      print(f"Slide {i+2}: {file}")
+
+   regressions = []
+   if args.check:
+      start = time.perf_counter()
+      regressions = check_fingerprints(FINGERPRINTS, args.fingerprints)
+      print(f"Checked {len(FINGERPRINTS)} slides in {time.perf_counter() - start:.2f}s: "
+            f"{len(regressions) or 'none'} changed")
+   if args.calibrate:
+      save_calibration(CALIBRATION, RENDER_PROFILE, OUTPUT_DPI, args.rasterizers)
+      for name, result in CALIBRATION.items():
+         timings = ', '.join(f"{rasterizer} {seconds:.3f}s" + (' (output differs)' if rasterizer in result['rejected'] else '')
+                             for rasterizer, seconds in result['seconds'].items())
+         print(f"{name}: {result['rasterizer']} ({timings})")
+      print(f"Stored rasterizer choices for profile {RENDER_PROFILE} at {OUTPUT_DPI} dpi in {args.rasterizers}")
+   if args.update_fingerprints:
+      save_fingerprints(FINGERPRINTS, args.fingerprints)
+      print(f"Stored fingerprints of {len(FINGERPRINTS)} slides in {args.fingerprints}")
+   if args.publish and not regressions:
+      manifest_path, published = publish_slides([os.path.join(OUTPUT_SINK.directory, file) for file in visual_files],
+                                                args.publish)
+      print(f"Published {published} new of {len(visual_files)} slides, manifest in {manifest_path}")
+
+   if args.metrics_file:
+      # Write then rename so a textfile collector never reads a partial file
+      _write_atomic(args.metrics_file, METRICS.exposition().encode())
+
+   if regressions:
+      raise SystemExit(1)
\ No newline at end of file